@@ -1,22 +1,7 @@
 # -*- coding: utf-8 -*-
-from graphene.pyutils.version import get_version
+from importlib import import_module
 
-from .directives import all_directives
-from .fields import (
-    DjangoFilterListField,
-    DjangoFilterPaginateListField,
-    DjangoListObjectField,
-    DjangoObjectField,
-)
-from .middleware import ExtraGraphQLDirectiveMiddleware
-from .mutation import DjangoSerializerMutation
-from .paginations import LimitOffsetGraphqlPagination, PageGraphqlPagination
-from .types import (
-    DjangoInputObjectType,
-    DjangoListObjectType,
-    DjangoObjectType,
-    DjangoSerializerType,
-)
+from graphene.pyutils.version import get_version
 
 VERSION = (0, 4, 9, "final", "")
 
@@ -44,3 +29,48 @@ __all__ = (
     "all_directives",
     "ExtraGraphQLDirectiveMiddleware",
 )
+
+# Public names are imported from their submodule on first access (PEP 562),
+# so importing the package doesn't load django-filter, DRF, etc.
+_LAZY_IMPORTS = {
+    # FIELDS
+    "DjangoObjectField": ".fields",
+    "DjangoFilterListField": ".fields",
+    "DjangoFilterPaginateListField": ".fields",
+    "DjangoListObjectField": ".fields",
+    # MUTATIONS
+    "DjangoSerializerMutation": ".mutation",
+    # PAGINATION
+    "LimitOffsetGraphqlPagination": ".paginations",
+    "PageGraphqlPagination": ".paginations",
+    # TYPES
+    "DjangoObjectType": ".types",
+    "DjangoListObjectType": ".types",
+    "DjangoInputObjectType": ".types",
+    "DjangoSerializerType": ".types",
+    # DIRECTIVES
+    "all_directives": ".directives",
+    "ExtraGraphQLDirectiveMiddleware": ".middleware",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        # Submodules, e.g. graphene_django_extras.types, as when they were imported eagerly
+        try:
+            return import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != "{}.{}".format(__name__, name):
+                raise
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            ) from None
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,16 +1,17 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 
-import binascii
 import datetime
 
 import graphene
+from django.db.models import QuerySet
+from django.utils.hashable import make_hashable
 from graphene.types.datetime import Date, DateTime, Time
 from graphene.utils.str_converters import to_camel_case
 from graphql.language import ast
 
 
-def factory_type(operation, _type, *args, **kwargs):
+def _build_factory_type(operation, _type, *args, **kwargs):
     if operation == "output":
 
         class GenericType(_type):
@@ -78,26 +79,117 @@ def factory_type(operation, _type, *args, **kwargs):
     return None
 
 
+_FACTORY_TYPE_CACHE = {}
+
+# Keyword arguments used by each operation, the others don't change the built type
+_FACTORY_TYPE_KWARGS = {
+    "output": (
+        "model",
+        "name",
+        "only_fields",
+        "exclude_fields",
+        "include_fields",
+        "filter_fields",
+        "filterset_class",
+        "registry",
+        "skip_registry",
+    ),
+    "input": (
+        "model",
+        "name",
+        "only_fields",
+        "exclude_fields",
+        "nested_fields",
+        "registry",
+        "skip_registry",
+    ),
+    "list": (
+        "model",
+        "name",
+        "only_fields",
+        "exclude_fields",
+        "filter_fields",
+        "filterset_class",
+        "results_field_name",
+        "pagination",
+        "queryset",
+        "registry",
+    ),
+}
+
+
+def factory_type(operation, _type, *args, **kwargs):
+    """
+    Build the generic type for the given operation, reusing the previously built
+    one when called again with the same arguments.
+    """
+    used_kwargs = tuple(kwargs.get(name) for name in _FACTORY_TYPE_KWARGS.get(operation, ()))
+    try:
+        key = (operation, _type, args, make_hashable(used_kwargs))
+    except TypeError:
+        key = None
+
+    if key is not None and key in _FACTORY_TYPE_CACHE:
+        return _FACTORY_TYPE_CACHE[key]
+
+    generic_type = _build_factory_type(operation, _type, *args, **kwargs)
+    if key is not None and generic_type is not None:
+        _FACTORY_TYPE_CACHE[key] = generic_type
+
+    return generic_type
+
+
+def reset_factory_type_cache():
+    _FACTORY_TYPE_CACHE.clear()
+
+
 class DjangoListObjectBase(object):
-    def __init__(self, results, count, results_field_name="results"):
+    def __init__(self, results, count=None, results_field_name="results"):
         self.results = results
-        self.count = count
+        self._count = count
         self.results_field_name = results_field_name
 
+    @property
+    def count(self):
+        """
+        When no count is given it is computed on first access, so the COUNT
+        query only runs when the count (totalCount) is actually selected.
+        """
+        if self._count is None:
+            if isinstance(self.results, QuerySet):
+                self._count = self.results.count()
+            else:
+                self._count = len(self.results)
+        return self._count
+
+    @count.setter
+    def count(self, value):
+        self._count = value
+
+    def iter_results(self):
+        return (e.to_dict() for e in self.results)
+
     def to_dict(self):
-        return {
-            self.results_field_name: [e.to_dict() for e in self.results],
-            "count": self.count,
-        }
+        return {self.results_field_name: list(self.iter_results()), "count": self.count}
+
+    def to_dict_from_values(self, *fields):
+        """
+        Like to_dict, but reads the rows with QuerySet.values() so no model
+        instances are built. Requires the results to be a queryset.
+        """
+        return {self.results_field_name: list(self.results.values(*fields)), "count": self.count}
+
+
+_GFK_RESOLVERS = {
+    "app_label": lambda instance: instance._meta.app_label,
+    "id": lambda instance: instance.id,
+    "model_name": lambda instance: instance._meta.model.__name__,
+}
 
 
 def resolver(attr_name, root, instance, info):
-    if attr_name == "app_label":
-        return instance._meta.app_label
-    elif attr_name == "id":
-        return instance.id
-    elif attr_name == "model_name":
-        return instance._meta.model.__name__
+    attr_resolver = _GFK_RESOLVERS.get(attr_name)
+    return attr_resolver(instance) if attr_resolver is not None else None
 
 
 class GenericForeignKeyType(graphene.ObjectType):
@@ -129,7 +221,7 @@ class Binary(graphene.Scalar):
 
     @staticmethod
     def binary_to_string(value):
-        return binascii.hexlify(value).decode("utf-8")
+        return value.hex() if value is not None else None
 
     serialize = binary_to_string
     parse_value = binary_to_string
@@ -148,6 +240,13 @@ class CustomDateFormat(object):
 class CustomTime(Time):
     @staticmethod
     def serialize(time):
+        # Exact type checks first, isinstance() below handles subclasses
+        time_type = type(time)
+        if time_type is datetime.time:
+            return time.isoformat()
+        if time_type is datetime.datetime:
+            return time.time().isoformat()
+
         if isinstance(time, CustomDateFormat):
             return time.date_str
 
@@ -163,6 +262,12 @@ class CustomTime(Time):
 class CustomDate(Date):
     @staticmethod
     def serialize(date):
+        date_type = type(date)
+        if date_type is datetime.date:
+            return date.isoformat()
+        if date_type is datetime.datetime:
+            return date.date().isoformat()
+
         if isinstance(date, CustomDateFormat):
             return date.date_str
 
@@ -177,6 +282,10 @@ class CustomDate(Date):
 class CustomDateTime(DateTime):
     @staticmethod
     def serialize(dt):
+        dt_type = type(dt)
+        if dt_type is datetime.datetime or dt_type is datetime.date:
+            return dt.isoformat()
+
         if isinstance(dt, CustomDateFormat):
             return dt.date_str
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import re
 from collections import OrderedDict
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRel, GenericRelation
@@ -9,6 +9,7 @@ from django.db import models
 from django.utils.encoding import force_str
 from graphene import ID, UUID, Boolean, Dynamic, Enum, Field, Float, Int, List, NonNull, String
 from graphene.types.json import JSONString
+from graphene.types.utils import get_field_as
 from graphene.utils.str_converters import to_camel_case
 from graphene_django.compat import ArrayField, HStoreField, JSONField, RangeField
 from graphene_django.utils.str_converters import to_const
@@ -149,6 +150,71 @@ def construct_fields(
     return fields
 
 
+def _normalize_field_names(names):
+    if isinstance(names, str):
+        return names
+    return tuple(sorted(names)) if names else ()
+
+
+@lru_cache(maxsize=None)
+def _cached_construct_fields(
+    model,
+    registry,
+    only_fields,
+    include_fields,
+    exclude_fields,
+    input_flag,
+    nested_fields,
+    _as,
+    debug,
+):
+    # "debug" is only part of the cache key, settings.DEBUG changes the field order
+    fields = construct_fields(
+        model, registry, only_fields, include_fields, exclude_fields, input_flag, nested_fields
+    )
+    # Same as yank_fields_from_attrs, without the intermediate list and sort: the
+    # converted fields are already in creation order. Converters may return None.
+    mounted_fields = OrderedDict()
+    for name, field in fields.items():
+        field = get_field_as(field, _as=_as)
+        if field:
+            mounted_fields[name] = field
+    return mounted_fields
+
+
+def construct_and_yank_fields(
+    model,
+    registry,
+    only_fields,
+    include_fields,
+    exclude_fields,
+    input_flag=None,
+    nested_fields=(),
+    _as=Field,
+):
+    """
+    Convert the model fields and mount them as _as (Field or InputField), i.e.
+    construct_fields followed by yank_fields_from_attrs. The result is cached for
+    each combination of arguments, a copy is returned so it can be modified.
+    """
+    fields = _cached_construct_fields(
+        model,
+        registry,
+        _normalize_field_names(only_fields),
+        _normalize_field_names(include_fields),
+        _normalize_field_names(exclude_fields),
+        input_flag,
+        _normalize_field_names(nested_fields),
+        _as,
+        settings.DEBUG,
+    )
+    return OrderedDict(fields)
+
+
+def reset_construct_fields_cache():
+    _cached_construct_fields.cache_clear()
+
+
 @singledispatch
 def convert_django_field(field, registry=None, input_flag=None, nested_field=False):
     raise Exception(
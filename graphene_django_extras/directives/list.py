@@ -16,6 +16,9 @@ class ShuffleGraphQLDirective(BaseExtraGraphQLDirective):
     @staticmethod
     def resolve(value, directive, root, info, **kwargs):
         if value:
+            # Querysets and other iterables can't be shuffled in place
+            if not isinstance(value, list):
+                value = list(value)
             random.shuffle(value)
 
         return value
@@ -28,6 +31,11 @@ class SampleGraphQLDirective(BaseExtraGraphQLDirective):
 
     @staticmethod
     def resolve(value, directive, root, info, **kwargs):
-        k_argument = [arg for arg in directive.arguments if arg.name.value == "k"][0]
+        if not value:
+            return value
+
+        k_argument = next(arg for arg in directive.arguments if arg.name.value == "k")
         k = int(k_argument.value.value)
-        return random.sample(value, k) if value else value
+        if not isinstance(value, (list, tuple)):
+            value = list(value)
+        return random.sample(value, min(k, len(value)))
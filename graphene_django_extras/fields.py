@@ -1,19 +1,31 @@
 # -*- coding: utf-8 -*-
-import operator
 from functools import partial
 
 from graphene import ID, Argument, Field, List
-from graphene.types.structures import NonNull, Structure
+from graphene.types.structures import NonNull
 from graphene_django.fields import DjangoListField as DLF
 from graphene_django.filter.utils import get_filtering_args_from_filterset
 from graphene_django.utils import DJANGO_FILTER_INSTALLED, is_valid_django_model, maybe_queryset
 
-from graphene_django_extras.filters.filter import get_filterset_class
+from graphene_django_extras.filters.filter import filter_queryset, get_filterset_class
 from graphene_django_extras.settings import graphql_api_settings
 
 from .base_types import DjangoListObjectBase
 from .paginations.pagination import BaseDjangoGraphqlPagination
-from .utils import find_field, get_extra_filters, get_related_fields, queryset_factory
+from .utils import find_related_field, get_extra_filters, queryset_factory
+
+_ID_DESCRIPTION = "Django object unique identification field"
+
+
+def _install_id_argument(filtering_args, args):
+    """
+    Add an 'id' filtering argument when the field does not declare one yet.
+    The same Argument instance is shared by both dicts.
+    """
+    if "id" not in args:
+        argument = Argument(ID, description=_ID_DESCRIPTION)
+        filtering_args["id"] = argument
+        args["id"] = argument
 
 
 # *********************************************** #
@@ -21,7 +33,7 @@ from .utils import find_field, get_extra_filters, get_related_fields, queryset_f
 # *********************************************** #
 class DjangoObjectField(Field):
     def __init__(self, _type, *args, **kwargs):
-        kwargs["id"] = ID(required=True, description="Django object unique identification field")
+        kwargs["id"] = ID(required=True, description=_ID_DESCRIPTION)
 
         super(DjangoObjectField, self).__init__(_type, *args, **kwargs)
 
@@ -33,10 +45,7 @@ class DjangoObjectField(Field):
     def object_resolver(manager, root, info, **kwargs):
         id = kwargs.pop("id", None)
 
-        try:
-            return manager.get_queryset().get(pk=id)
-        except manager.model.DoesNotExist:
-            return None
+        return manager.get_queryset().filter(pk=id).first()
 
     def wrap_resolve(self, parent_resolver):
         return partial(self.object_resolver, self.type._meta.model._default_manager)
@@ -77,65 +86,55 @@ class DjangoFilterListField(Field):
             kwargs.setdefault("args", {})
             kwargs["args"].update(self.filtering_args)
 
-            if "id" not in kwargs["args"].keys():
-                self.filtering_args.update(
-                    {"id": Argument(ID, description="Django object unique identification field")}
-                )
-                kwargs["args"].update(
-                    {"id": Argument(ID, description="Django object unique identification field")}
-                )
+            _install_id_argument(self.filtering_args, kwargs["args"])
+
+            self.filtering_arg_names = frozenset(self.filtering_args)
 
         if not kwargs.get("description", None):
             kwargs["description"] = "{} list".format(_type._meta.model.__name__)
 
         super(DjangoFilterListField, self).__init__(List(_type), *args, **kwargs)
 
+        # The model type is known here, no need to unwrap self.type later
+        self._manager = _type._meta.model._default_manager
+
     @property
     def model(self):
         return self.type.of_type._meta.node._meta.model
 
     @staticmethod
-    def list_resolver(manager, filterset_class, filtering_args, root, info, **kwargs):
+    def list_resolver(manager, filterset_class, filtering_arg_names, root, info, **kwargs):
         qs = None
         field = None
 
         if root and is_valid_django_model(root._meta.model):
-            available_related_fields = get_related_fields(root._meta.model)
-            field = find_field(info.field_nodes[0], available_related_fields)
-        filter_kwargs = {k: v for k, v in kwargs.items() if k in filtering_args}
+            field = find_related_field(root._meta.model, info.field_nodes[0])
+        filter_kwargs = {k: kwargs[k] for k in kwargs.keys() & filtering_arg_names}
 
         if field is not None:
             try:
-                if filter_kwargs:
-                    qs = operator.attrgetter(
-                        "{}.filter".format(getattr(field, "related_name", None) or field.name)
-                    )(root)(**filter_kwargs)
-                else:
-                    qs = operator.attrgetter(
-                        "{}.all".format(getattr(field, "related_name", None) or field.name)
-                    )(root)()
+                related = getattr(root, getattr(field, "related_name", None) or field.name)
+                qs = related.filter(**filter_kwargs) if filter_kwargs else related.all()
             except AttributeError:
                 qs = None
 
         if qs is None:
             qs = queryset_factory(manager, root, info, **kwargs)
-            qs = filterset_class(data=filter_kwargs, queryset=qs, request=info.context).qs
+            qs = filter_queryset(filterset_class, filter_kwargs, qs, info.context)
 
             if root and is_valid_django_model(root._meta.model):
                 extra_filters = get_extra_filters(root, manager.model)
-                qs = qs.filter(**extra_filters)
+                if extra_filters:
+                    qs = qs.filter(**extra_filters)
 
         return maybe_queryset(qs)
 
     def wrap_resolve(self, parent_resolver):
-        current_type = self.type
-        while isinstance(current_type, Structure):
-            current_type = current_type.of_type
         return partial(
             self.list_resolver,
-            current_type._meta.model._default_manager,
+            self._manager,
             self.filterset_class,
-            self.filtering_args,
+            self.filtering_arg_names,
         )
 
 
@@ -164,13 +163,9 @@ class DjangoFilterPaginateListField(Field):
         kwargs.setdefault("args", {})
         kwargs["args"].update(self.filtering_args)
 
-        if "id" not in kwargs["args"].keys():
-            self.filtering_args.update(
-                {"id": Argument(ID, description="Django object unique identification field")}
-            )
-            kwargs["args"].update(
-                {"id": Argument(ID, description="Django object unique identification field")}
-            )
+        _install_id_argument(self.filtering_args, kwargs["args"])
+
+        self.filtering_arg_names = frozenset(self.filtering_args)
 
         pagination = pagination or graphql_api_settings.DEFAULT_PAGINATION_CLASS()
 
@@ -189,6 +184,8 @@ class DjangoFilterPaginateListField(Field):
 
         super(DjangoFilterPaginateListField, self).__init__(List(NonNull(_type)), *args, **kwargs)
 
+        self._manager = _type._meta.model._default_manager
+
     @property
     def model(self):
         return self.type.of_type._meta.node._meta.model
@@ -196,14 +193,15 @@ class DjangoFilterPaginateListField(Field):
     def get_queryset(self, manager, root, info, **kwargs):
         return queryset_factory(manager, root, info, **kwargs)
 
-    def list_resolver(self, manager, filterset_class, filtering_args, root, info, **kwargs):
-        filter_kwargs = {k: v for k, v in kwargs.items() if k in filtering_args}
+    def list_resolver(self, manager, filterset_class, filtering_arg_names, root, info, **kwargs):
+        filter_kwargs = {k: kwargs[k] for k in kwargs.keys() & filtering_arg_names}
         qs = self.get_queryset(manager, root, info, **kwargs)
-        qs = filterset_class(data=filter_kwargs, queryset=qs, request=info.context).qs
+        qs = filter_queryset(filterset_class, filter_kwargs, qs, info.context)
 
         if root and is_valid_django_model(root._meta.model):
             extra_filters = get_extra_filters(root, manager.model)
-            qs = qs.filter(**extra_filters)
+            if extra_filters:
+                qs = qs.filter(**extra_filters)
 
         if getattr(self, "pagination", None):
             qs = self.pagination.paginate_queryset(qs, **kwargs)
@@ -211,14 +209,11 @@ class DjangoFilterPaginateListField(Field):
         return maybe_queryset(qs)
 
     def wrap_resolve(self, parent_resolver):
-        current_type = self.type
-        while isinstance(current_type, Structure):
-            current_type = current_type.of_type
         return partial(
             self.list_resolver,
-            current_type._meta.model._default_manager,
+            self._manager,
             self.filterset_class,
-            self.filtering_args,
+            self.filtering_arg_names,
         )
 
 
@@ -248,30 +243,31 @@ class DjangoListObjectField(Field):
             kwargs.setdefault("args", {})
             kwargs["args"].update(self.filtering_args)
 
-            if "id" not in kwargs["args"].keys():
-                id_description = "Django object unique identification field"
-                self.filtering_args.update({"id": Argument(ID, description=id_description)})
-                kwargs["args"].update({"id": Argument(ID, description=id_description)})
+            _install_id_argument(self.filtering_args, kwargs["args"])
+
+            self.filtering_arg_names = frozenset(self.filtering_args)
 
         if not kwargs.get("description", None):
             kwargs["description"] = "{} list".format(_type._meta.model.__name__)
 
         super(DjangoListObjectField, self).__init__(_type, *args, **kwargs)
 
+        self._manager = _type._meta.model._default_manager
+
     @property
     def model(self):
         return self.type._meta.model
 
-    def list_resolver(self, manager, filterset_class, filtering_args, root, info, **kwargs):
+    def list_resolver(self, manager, filterset_class, filtering_arg_names, root, info, **kwargs):
         qs = queryset_factory(manager, root, info, **kwargs)
 
-        filter_kwargs = {k: v for k, v in kwargs.items() if k in filtering_args}
+        filter_kwargs = {k: kwargs[k] for k in kwargs.keys() & filtering_arg_names}
 
-        qs = filterset_class(data=filter_kwargs, queryset=qs, request=info.context).qs
-        count = qs.count()
+        qs = filter_queryset(filterset_class, filter_kwargs, qs, info.context)
 
+        # The count is left to DjangoListObjectBase, so it is only computed when
+        # requested and reuses the rows when the results were evaluated first.
         return DjangoListObjectBase(
-            count=count,
             results=maybe_queryset(qs),
             results_field_name=self.type._meta.results_field_name,
         )
@@ -279,7 +275,7 @@ class DjangoListObjectField(Field):
     def wrap_resolve(self, parent_resolver):
         return partial(
             self.list_resolver,
-            self.type._meta.model._default_manager,
+            self._manager,
             self.filterset_class,
-            self.filtering_args,
+            self.filtering_arg_names,
         )
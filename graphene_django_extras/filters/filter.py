@@ -1,12 +1,32 @@
 # -*- coding: utf-8 -*-
+from functools import lru_cache
+
+from django.utils.hashable import make_hashable
 from django_filters.filterset import FILTER_FOR_DBFIELD_DEFAULTS, BaseFilterSet, FilterSet
 from graphene_django.filter.utils import replace_csv_filters
 
+_FILTERSET_CACHE = {}
+
+
+def _filterset_cache_key(filterset_class, meta):
+    if filterset_class:
+        # The meta data is ignored when a FilterSet class is given.
+        return (filterset_class,)
+
+    try:
+        return (None, make_hashable(meta))
+    except TypeError:
+        return None
+
 
 def get_filterset_class(filterset_class, **meta):
     """
     Get the class to be used as the FilterSet.
     """
+    key = _filterset_cache_key(filterset_class, meta)
+    if key is not None and key in _FILTERSET_CACHE:
+        return _FILTERSET_CACHE[key]
+
     if filterset_class:
         # If were given a FilterSet class, then set it up.
         graphene_filterset_class = setup_filterset(filterset_class)
@@ -16,9 +36,41 @@ def get_filterset_class(filterset_class, **meta):
 
     replace_csv_filters(graphene_filterset_class)
 
+    if key is not None:
+        _FILTERSET_CACHE[key] = graphene_filterset_class
+
     return graphene_filterset_class
 
 
+def reset_filterset_cache():
+    _FILTERSET_CACHE.clear()
+
+
+@lru_cache(maxsize=None)
+def has_custom_filtering(filterset_class):
+    """
+    Whether the FilterSet may change the queryset even when no filtering argument
+    was given. Only the FilterSets built by custom_filterset_factory are known not
+    to, a given filterset_class always runs.
+    """
+    return (
+        not filterset_class.__dict__.get("_from_filterset_factory", False)
+        or filterset_class.__init__ is not BaseFilterSet.__init__
+        or filterset_class.qs is not BaseFilterSet.qs
+        or filterset_class.filter_queryset is not BaseFilterSet.filter_queryset
+    )
+
+
+def filter_queryset(filterset_class, data, queryset, request=None):
+    """
+    Filter the queryset with the given FilterSet, skipping the FilterSet (and its
+    form validation) when there is nothing to filter by.
+    """
+    if not data and not has_custom_filtering(filterset_class):
+        return queryset
+    return filterset_class(data=data, queryset=queryset, request=request).qs
+
+
 class GrapheneFilterSetMixin(BaseFilterSet):
     FILTER_DEFAULTS = FILTER_FOR_DBFIELD_DEFAULTS
 
@@ -41,6 +93,6 @@ def custom_filterset_factory(model, filterset_base_class=FilterSet, **meta):
     filterset = type(
         str("%sFilterSet" % model._meta.object_name),
         (filterset_base_class, GrapheneFilterSetMixin),
-        {"Meta": meta_class},
+        {"Meta": meta_class, "_from_filterset_factory": True},
     )
     return filterset
@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
+import sys
+from functools import lru_cache
+from threading import Lock
+
 from graphene.utils.str_converters import to_camel_case
 
 
@@ -7,19 +11,25 @@ class Registry(object):
     Custom registry implementation for use on DjangoObjectType and DjangoInputObjectType
     """
 
+    __slots__ = ("_registry", "_registry_models", "_registry_directives", "_lock")
+
     def __init__(self):
         self._registry = {}
         self._registry_models = {}
         self._registry_directives = {}
+        # Only writes are serialized, dict reads are atomic.
+        self._lock = Lock()
 
     def register_enum(self, key, enum):
-        self._registry[key] = enum
+        with self._lock:
+            self._registry[key] = enum
 
     def get_type_for_enum(self, key):
         return self._registry.get(key)
 
     def register_directive(self, name, directive):
-        self._registry_directives[name] = directive
+        with self._lock:
+            self._registry_directives[name] = directive
 
     def get_directive(self, name):
         return self._registry_directives.get(name)
@@ -35,32 +45,43 @@ class Registry(object):
         assert cls._meta.registry == self, "Registry for a Model have to match."
 
         if not getattr(cls._meta, "skip_registry", False):
-            key = (
-                "{}_{}".format(cls._meta.model.__name__.lower(), for_input)
-                if for_input
-                else cls._meta.model.__name__.lower()
-            )
-            self._registry[to_camel_case(key)] = cls
+            key = _registry_key(cls._meta.model, for_input)
+            with self._lock:
+                self._registry[key] = cls
 
     def get_type_for_model(self, model, for_input=None):
+        return self._registry.get(_registry_key(model, for_input))
+
+
+_REGISTRY_KEY_CACHE = {}
+
+
+def _registry_key(model, for_input=None):
+    """
+    Registry key of a model, e.g. 'user' or 'userCreate', computed once per (model, for_input)
+    """
+    cache_key = (model, for_input)
+    key = _REGISTRY_KEY_CACHE.get(cache_key)
+    if key is None:
         key = (
             "{}_{}".format(model.__name__.lower(), for_input)
             if for_input
             else model.__name__.lower()
         )
-        return self._registry.get(to_camel_case(key))
-
-
-registry = None
+        key = sys.intern(to_camel_case(key))
+        _REGISTRY_KEY_CACHE[cache_key] = key
+    return key
 
 
+@lru_cache(maxsize=None)
 def get_global_registry():
-    global registry
-    if not registry:
-        registry = Registry()
-    return registry
+    return Registry()
 
 
 def reset_global_registry():
-    global registry
-    registry = None
+    from .base_types import reset_factory_type_cache
+    from .converter import reset_construct_fields_cache
+
+    get_global_registry.cache_clear()
+    reset_factory_type_cache()
+    reset_construct_fields_cache()
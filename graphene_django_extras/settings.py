@@ -23,19 +23,27 @@ class GraphQLAPISettings(APISettings):
 
     @property
     def user_settings(self):
-        if not hasattr(self, "_user_settings"):
-            self._user_settings = getattr(settings, "GRAPHENE_DJANGO_EXTRAS", {})
-        return self._user_settings
+        # Look in the instance dict directly, hasattr() would go through
+        # APISettings.__getattr__ and raise an AttributeError on every miss.
+        user_settings = self.__dict__.get("_user_settings")
+        if user_settings is None:
+            user_settings = getattr(settings, "GRAPHENE_DJANGO_EXTRAS", {})
+            self._user_settings = user_settings
+        return user_settings
 
 
 graphql_api_settings = GraphQLAPISettings(None, DEFAULTS, IMPORT_STRINGS)
 
 
 def reload_graphql_api_settings(*args, **kwargs):
-    global graphql_api_settings
-    setting, value = kwargs["setting"], kwargs["value"]
+    setting = kwargs["setting"]
     if setting == "GRAPHENE_DJANGO_EXTRAS":
-        graphql_api_settings = GraphQLAPISettings(value, DEFAULTS, IMPORT_STRINGS)
+        from .filters.filter import reset_filterset_cache
+
+        # Reload in place, so the modules that imported graphql_api_settings see
+        # the new values. Resolved settings are cached again as plain attributes.
+        graphql_api_settings.reload()
+        reset_filterset_cache()
 
 
 setting_changed.connect(reload_graphql_api_settings)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from collections import OrderedDict
+from collections.abc import Mapping
+from sys import intern
 
 from django.db.models import QuerySet
 from django.utils.functional import SimpleLazyObject
@@ -13,12 +14,12 @@ from graphene_django.types import ErrorType
 from graphene_django.utils import DJANGO_FILTER_INSTALLED, is_valid_django_model, maybe_queryset
 
 from .base_types import DjangoListObjectBase, factory_type
-from .converter import construct_fields
+from .converter import construct_and_yank_fields
 from .fields import DjangoListField, DjangoListObjectField, DjangoObjectField
 from .paginations.pagination import BaseDjangoGraphqlPagination
 from .registry import Registry, get_global_registry
 from .settings import graphql_api_settings
-from .utils import get_Object_or_None, queryset_factory
+from .utils import queryset_factory
 
 __all__ = (
     "DjangoObjectType",
@@ -28,6 +29,10 @@ __all__ = (
 )
 
 
+# Graphene's own bases, they don't declare any input field
+_INPUT_OBJECT_TYPE_BASES = frozenset(InputObjectType.__mro__)
+
+
 class DjangoObjectOptions(BaseOptions):
     fields = None
     input_fields = None
@@ -43,12 +48,68 @@ class DjangoObjectOptions(BaseOptions):
     filterset_class = None
 
 
+def build_mutation_arguments(options, operation):
+    """
+    Build the arguments of a DjangoSerializerType mutation from its options
+    """
+    if operation == "delete":
+        arguments = {
+            "id": Argument(
+                ID,
+                required=True,
+                description="Django object unique identification field",
+            )
+        }
+    else:
+        input_type = options.registry.get_type_for_model(options.model, for_input=operation)
+        if not input_type:
+            input_type = factory_type(
+                "input", DjangoInputObjectType, operation, **options.factory_kwargs
+            )
+        arguments = {options.input_field_name: Argument(input_type, required=True)}
+
+    arguments.update(options.extra_arguments)
+    return arguments
+
+
+class MutationArguments(Mapping):
+    """
+    Mutation arguments by operation, each operation is built on first access
+    """
+
+    operations = ("create", "delete", "update")
+
+    def __init__(self, options):
+        self._options = options
+        self._arguments = {}
+
+    def __getitem__(self, operation):
+        arguments = self._arguments.get(operation)
+        if arguments is None:
+            if operation not in self.operations:
+                raise KeyError(operation)
+            arguments = build_mutation_arguments(self._options, operation)
+            self._arguments[operation] = arguments
+        return arguments
+
+    def __contains__(self, operation):
+        return operation in self.operations
+
+    def __iter__(self):
+        return iter(self.operations)
+
+    def __len__(self):
+        return len(self.operations)
+
+
 class DjangoSerializerOptions(BaseOptions):
     model = None
     queryset = None
     serializer_class = None
 
     arguments = None
+    extra_arguments = None
+    factory_kwargs = None
     fields = None
     input_fields = None
     input_field_name = None
@@ -56,10 +117,57 @@ class DjangoSerializerOptions(BaseOptions):
     mutation_output = None
     output_field_name = None
     output_type = None
-    output_list_type = None
     nested_fields = None
+    manages_nested_fields = False
+    update_select_related = ()
     interfaces = ()
 
+    def __init__(self, class_type):
+        super(DjangoSerializerOptions, self).__init__(class_type)
+        # The options are frozen after the class creation, lazily built types
+        # are kept in this dict instead.
+        self._lazy_types = {}
+
+    @property
+    def output_list_type(self):
+        output_list_type = self._lazy_types.get("list")
+        if output_list_type is None:
+            output_list_type = factory_type("list", DjangoListObjectType, **self.factory_kwargs)
+            self._lazy_types["list"] = output_list_type
+        return output_list_type
+
+
+def get_serializer_select_related(serializer_class, model):
+    """
+    Forward relations of the model handled by the serializer, to be fetched with
+    select_related() together with the instance to update.
+    """
+    serializer_meta = serializer_class.Meta
+    fields = getattr(serializer_meta, "fields", None)
+    exclude = getattr(serializer_meta, "exclude", None) or ()
+
+    return tuple(
+        field.name
+        for field in model._meta.get_fields()
+        if field.is_relation
+        and field.concrete
+        and (field.many_to_one or field.one_to_one)
+        and (fields in (None, "__all__") or field.name in fields)
+        and field.name not in exclude
+    )
+
+
+def add_uploaded_files(data, request):
+    """
+    Add the files uploaded on a multipart request to the mutation data
+    """
+    files = getattr(request, "FILES", None)
+    if files and "multipart/form-data" in (request.META.get("CONTENT_TYPE") or ""):
+        data.update(files.items())
+
+
+_IS_TYPE_OF_CACHE = {}
+
 
 class DjangoObjectType(ObjectType):
     @classmethod
@@ -76,25 +184,29 @@ class DjangoObjectType(ObjectType):
         filterset_class=None,
         **options,
     ):
-        assert is_valid_django_model(model), (
-            'You need to pass a valid Django Model in {}.Meta, received "{}".'
-        ).format(cls.__name__, model)
+        if not is_valid_django_model(model):
+            raise TypeError(
+                'You need to pass a valid Django Model in {}.Meta, received "{}".'.format(
+                    cls.__name__, model
+                )
+            )
 
         if not registry:
             registry = get_global_registry()
 
-        assert isinstance(registry, Registry), (
-            "The attribute registry in {} needs to be an instance of " 'Registry, received "{}".'
-        ).format(cls.__name__, registry)
+        if not isinstance(registry, Registry):
+            raise TypeError(
+                "The attribute registry in {} needs to be an instance of "
+                'Registry, received "{}".'.format(cls.__name__, registry)
+            )
 
         if not DJANGO_FILTER_INSTALLED and (filter_fields or filterset_class):
             raise Exception(
                 "Can only set filter_fields or filterset_class if Django-Filter is installed"
             )
 
-        django_fields = yank_fields_from_attrs(
-            construct_fields(model, registry, only_fields, include_fields, exclude_fields),
-            _as=Field,
+        django_fields = construct_and_yank_fields(
+            model, registry, only_fields, include_fields, exclude_fields, _as=Field
         )
 
         _meta = DjangoObjectOptions(cls)
@@ -119,11 +231,19 @@ class DjangoObjectType(ObjectType):
         if isinstance(root, SimpleLazyObject):
             root._setup()
             root = root._wrapped
-        if isinstance(root, cls):
-            return True
-        if not is_valid_django_model(type(root)):
-            raise Exception(('Received incompatible instance "{}".').format(root))
-        return isinstance(root, cls._meta.model)
+
+        # The answer only depends on the class of root, so it's computed once per class
+        key = (cls, type(root))
+        is_type = _IS_TYPE_OF_CACHE.get(key)
+        if is_type is None:
+            if isinstance(root, cls):
+                is_type = True
+            elif not is_valid_django_model(type(root)):
+                raise Exception(('Received incompatible instance "{}".').format(root))
+            else:
+                is_type = isinstance(root, cls._meta.model)
+            _IS_TYPE_OF_CACHE[key] = is_type
+        return is_type
 
     @classmethod
     def get_queryset(cls, queryset, info):
@@ -131,10 +251,7 @@ class DjangoObjectType(ObjectType):
 
     @classmethod
     def get_node(cls, info, id):
-        try:
-            return cls._meta.model.objects.get(pk=id)
-        except cls._meta.model.DoesNotExist:
-            return None
+        return cls._meta.model._default_manager.filter(pk=id).first()
 
 
 class DjangoInputObjectType(InputObjectType):
@@ -154,41 +271,49 @@ class DjangoInputObjectType(InputObjectType):
         nested_fields=(),
         **options,
     ):
-        assert is_valid_django_model(model), (
-            'You need to pass a valid Django Model in {}.Meta, received "{}".'
-        ).format(cls.__name__, model)
+        if not is_valid_django_model(model):
+            raise TypeError(
+                'You need to pass a valid Django Model in {}.Meta, received "{}".'.format(
+                    cls.__name__, model
+                )
+            )
 
         if not registry:
             registry = get_global_registry()
 
-        assert isinstance(registry, Registry), (
-            "The attribute registry in {} needs to be an instance of " 'Registry, received "{}".'
-        ).format(cls.__name__, registry)
+        if not isinstance(registry, Registry):
+            raise TypeError(
+                "The attribute registry in {} needs to be an instance of "
+                'Registry, received "{}".'.format(cls.__name__, registry)
+            )
 
-        assert input_for.lower not in ("create", "delete", "update"), (
-            'You need to pass a valid input_for value in {}.Meta, received "{}".'
-        ).format(cls.__name__, input_for)
+        if input_for.lower() not in ("create", "delete", "update"):
+            raise ValueError(
+                'You need to pass a valid input_for value in {}.Meta, received "{}".'.format(
+                    cls.__name__, input_for
+                )
+            )
 
         input_for = input_for.lower()
 
         if not DJANGO_FILTER_INSTALLED and filter_fields:
             raise Exception("Can only set filter_fields if Django-Filter is installed")
 
-        django_input_fields = yank_fields_from_attrs(
-            construct_fields(
-                model,
-                registry,
-                only_fields,
-                None,
-                exclude_fields,
-                input_for,
-                nested_fields,
-            ),
+        django_input_fields = construct_and_yank_fields(
+            model,
+            registry,
+            only_fields,
+            None,
+            exclude_fields,
+            input_for,
+            nested_fields,
             _as=InputField,
-            sort=False,
         )
 
         for base in reversed(cls.__mro__):
+            if base in _INPUT_OBJECT_TYPE_BASES or base is DjangoInputObjectType:
+                continue
+            # Yanked for each class, so a subclass doesn't share its parent's InputFields
             django_input_fields.update(yank_fields_from_attrs(base.__dict__, _as=InputField))
 
         if container is None:
@@ -241,9 +366,12 @@ class DjangoListObjectType(ObjectType):
         filterset_class=None,
         **options,
     ):
-        assert is_valid_django_model(model), (
-            'You need to pass a valid Django Model in {}.Meta, received "{}".'
-        ).format(cls.__name__, model)
+        if not is_valid_django_model(model):
+            raise TypeError(
+                'You need to pass a valid Django Model in {}.Meta, received "{}".'.format(
+                    cls.__name__, model
+                )
+            )
 
         if not registry:
             registry = get_global_registry()
@@ -251,14 +379,15 @@ class DjangoListObjectType(ObjectType):
         if not DJANGO_FILTER_INSTALLED and filter_fields:
             raise Exception("Can only set filter_fields if Django-Filter is installed")
 
-        assert isinstance(queryset, QuerySet) or queryset is None, (
-            "The attribute queryset in {} needs to be an instance of "
-            'Django model queryset, received "{}".'
-        ).format(cls.__name__, queryset)
+        if queryset is not None and not isinstance(queryset, QuerySet):
+            raise TypeError(
+                "The attribute queryset in {} needs to be an instance of "
+                'Django model queryset, received "{}".'.format(cls.__name__, queryset)
+            )
 
         results_field_name = results_field_name or "results"
 
-        baseType = get_global_registry().get_type_for_model(model)
+        baseType = registry.get_type_for_model(model)
 
         if not baseType:
             factory_kwargs = {
@@ -281,9 +410,11 @@ class DjangoListObjectType(ObjectType):
         else:
             global_paginator = graphql_api_settings.DEFAULT_PAGINATION_CLASS
             if global_paginator:
-                assert issubclass(global_paginator, BaseDjangoGraphqlPagination), (
-                    'You need to pass a valid DjangoGraphqlPagination class in {}.Meta, received "{}".'
-                ).format(cls.__name__, global_paginator)
+                if not issubclass(global_paginator, BaseDjangoGraphqlPagination):
+                    raise TypeError(
+                        "You need to pass a valid DjangoGraphqlPagination class in {}.Meta, "
+                        'received "{}".'.format(cls.__name__, global_paginator)
+                    )
 
                 global_paginator = global_paginator()
                 result_container = global_paginator.get_pagination_field(baseType)
@@ -300,19 +431,10 @@ class DjangoListObjectType(ObjectType):
         _meta.exclude_fields = exclude_fields
         _meta.only_fields = only_fields
         _meta.filterset_class = filterset_class
-        _meta.fields = OrderedDict(
-            [
-                (results_field_name, result_container),
-                (
-                    "count",
-                    Field(
-                        Int,
-                        name="totalCount",
-                        description="Total count of matches elements",
-                    ),
-                ),
-            ]
-        )
+        _meta.fields = {
+            results_field_name: result_container,
+            "count": Field(Int, name="totalCount", description="Total count of matches elements"),
+        }
 
         super(DjangoListObjectType, cls).__init_subclass_with_meta__(_meta=_meta, **options)
 
@@ -361,8 +483,9 @@ class DjangoSerializerType(ObjectType):
 
         description = description or "ModelSerializerType for {} model".format(model.__name__)
 
-        input_field_name = input_field_name or "new_{}".format(model._meta.model_name)
-        output_field_name = output_field_name or model._meta.model_name
+        model_name = model._meta.model_name
+        input_field_name = input_field_name or "new_{}".format(model_name)
+        output_field_name = output_field_name or model_name
 
         input_class = getattr(cls, "Arguments", None)
         if not input_class:
@@ -402,51 +525,34 @@ class DjangoSerializerType(ObjectType):
         if not output_type:
             output_type = factory_type("output", DjangoObjectType, **factory_kwargs)
 
-        output_list_type = factory_type("list", DjangoListObjectType, **factory_kwargs)
-
-        django_fields = OrderedDict({output_field_name: Field(output_type)})
-
-        global_arguments = {}
-        for operation in ("create", "delete", "update"):
-            global_arguments.update({operation: OrderedDict()})
-
-            if operation != "delete":
-                input_type = registry.get_type_for_model(model, for_input=operation)
-
-                if not input_type:
-                    # factory_kwargs.update({'skip_registry': True})
-                    input_type = factory_type(
-                        "input", DjangoInputObjectType, operation, **factory_kwargs
-                    )
-
-                global_arguments[operation].update(
-                    {input_field_name: Argument(input_type, required=True)}
-                )
-            else:
-                global_arguments[operation].update(
-                    {
-                        "id": Argument(
-                            ID,
-                            required=True,
-                            description="Django object unique identification field",
-                        )
-                    }
-                )
-            global_arguments[operation].update(arguments)
+        django_fields = {output_field_name: Field(output_type)}
 
         _meta = DjangoSerializerOptions(cls)
         _meta.mutation_output = cls
-        _meta.arguments = global_arguments
+        # The list type and the input types are only built when first needed
+        _meta.arguments = MutationArguments(_meta)
+        _meta.extra_arguments = arguments
+        _meta.factory_kwargs = factory_kwargs
         _meta.fields = django_fields
         _meta.output_type = output_type
-        _meta.output_list_type = output_list_type
         _meta.model = model
         _meta.registry = registry
-        _meta.queryset = queryset or model._default_manager
+        # Truth-testing a QuerySet would evaluate it, compare against None instead
+        _meta.queryset = queryset if queryset is not None else model._default_manager
         _meta.serializer_class = serializer_class
         _meta.input_field_name = input_field_name
         _meta.output_field_name = output_field_name
         _meta.nested_fields = nested_fields
+        # manage_nested_fields has nothing to do without nested serializers, unless overridden
+        # (a staticmethod override has no __func__)
+        manage_nested_fields = cls.manage_nested_fields
+        overrides_nested = getattr(manage_nested_fields, "__func__", manage_nested_fields) is not (
+            DjangoSerializerType.manage_nested_fields.__func__
+        )
+        _meta.manages_nested_fields = overrides_nested or (
+            bool(nested_fields) and isinstance(nested_fields, dict)
+        )
+        _meta.update_select_related = get_serializer_select_related(serializer_class, model)
 
         super(DjangoSerializerType, cls).__init_subclass_with_meta__(
             _meta=_meta, description=description, **options
@@ -498,11 +604,11 @@ class DjangoSerializerType(ObjectType):
     @classmethod
     def create(cls, root, info, **kwargs):
         data = kwargs.get(cls._meta.input_field_name)
-        request_type = info.context.META.get("CONTENT_TYPE", "")
-        if "multipart/form-data" in request_type:
-            data.update({name: value for name, value in info.context.FILES.items()})
+        add_uploaded_files(data, info.context)
 
-        nested_objs = cls.manage_nested_fields(data, root, info)
+        nested_objs = (
+            cls.manage_nested_fields(data, root, info) if cls._meta.manages_nested_fields else {}
+        )
         serializer = cls._meta.serializer_class(
             data=data, **cls.get_serializer_kwargs(root, info, **kwargs)
         )
@@ -511,14 +617,15 @@ class DjangoSerializerType(ObjectType):
         if not ok:
             return cls.get_errors(obj)
         elif nested_objs:
-            [getattr(obj, field).add(*objs) for field, objs in nested_objs.items()]
+            for field, objs in nested_objs.items():
+                getattr(obj, field).add(*objs)
         return cls.perform_mutate(obj, info)
 
     @classmethod
     def delete(cls, root, info, **kwargs):
         pk = kwargs.get("id")
 
-        old_obj = get_Object_or_None(cls._meta.model, pk=pk)
+        old_obj = cls._meta.model._default_manager.filter(pk=pk).first()
         if old_obj:
             old_obj.delete()
             old_obj.id = pk
@@ -538,14 +645,20 @@ class DjangoSerializerType(ObjectType):
     @classmethod
     def update(cls, root, info, **kwargs):
         data = kwargs.get(cls._meta.input_field_name)
-        request_type = info.context.META.get("CONTENT_TYPE", "")
-        if "multipart/form-data" in request_type:
-            data.update({name: value for name, value in info.context.FILES.items()})
+        add_uploaded_files(data, info.context)
 
         pk = data.pop("id")
-        old_obj = get_Object_or_None(cls._meta.model, pk=pk)
+        queryset = cls._meta.model._default_manager.all()
+        # select_related() without fields would follow every foreign key
+        if cls._meta.update_select_related:
+            queryset = queryset.select_related(*cls._meta.update_select_related)
+        old_obj = queryset.filter(pk=pk).first()
         if old_obj:
-            nested_objs = cls.manage_nested_fields(data, root, info)
+            nested_objs = (
+                cls.manage_nested_fields(data, root, info)
+                if cls._meta.manages_nested_fields
+                else {}
+            )
             serializer = cls._meta.serializer_class(
                 old_obj,
                 data=data,
@@ -557,7 +670,8 @@ class DjangoSerializerType(ObjectType):
             if not ok:
                 return cls.get_errors(obj)
             elif nested_objs:
-                [getattr(obj, field).add(*objs) for field, objs in nested_objs.items()]
+                for field, objs in nested_objs.items():
+                    getattr(obj, field).add(*objs)
             return cls.perform_mutate(obj, info)
         else:
             return cls.get_errors(
@@ -579,7 +693,8 @@ class DjangoSerializerType(ObjectType):
 
         else:
             errors = [
-                ErrorType(field=key, messages=value) for key, value in serialized_obj.errors.items()
+                ErrorType(field=intern(key), messages=value)
+                for key, value in serialized_obj.errors.items()
             ]
             return False, errors
 
@@ -587,22 +702,19 @@ class DjangoSerializerType(ObjectType):
     def retrieve(cls, manager, root, info, **kwargs):
         pk = kwargs.pop("id", None)
 
-        try:
-            return manager.get_queryset().get(pk=pk)
-        except manager.model.DoesNotExist:
-            return None
+        return manager.get_queryset().filter(pk=pk).first()
 
     @classmethod
     def list(cls, manager, filterset_class, filtering_args, root, info, **kwargs):
-        qs = queryset_factory(cls._meta.queryset or manager, root, info, **kwargs)
+        qs = queryset_factory(cls._meta.queryset, root, info, **kwargs)
 
-        filter_kwargs = {k: v for k, v in kwargs.items() if k in filtering_args}
+        if not isinstance(filtering_args, (set, frozenset, dict)):
+            filtering_args = frozenset(filtering_args)
+        filter_kwargs = {k: kwargs[k] for k in kwargs.keys() & filtering_args}
 
         qs = filterset_class(data=filter_kwargs, queryset=qs).qs
-        count = qs.count()
 
         return DjangoListObjectBase(
-            count=count,
             results=maybe_queryset(qs),
             results_field_name=cls.list_object_type()._meta.results_field_name,
         )
@@ -2,6 +2,7 @@
 import inspect
 import re
 from collections import OrderedDict
+from weakref import WeakKeyDictionary
 
 import six
 from django import VERSION as DJANGO_VERSION
@@ -289,11 +290,36 @@ def get_related_fields(model):
 
 
 def find_field(field, fields_dict):
-    temp = fields_dict.get(field.name.value, fields_dict.get(to_snake_case(field.name.value), None))
+    name = field.name.value
+    temp = fields_dict.get(name)
+    if temp is None:
+        temp = fields_dict.get(to_snake_case(name), None)
 
     return temp
 
 
+_related_fields_cache = WeakKeyDictionary()
+
+
+def get_cached_related_fields(model):
+    """
+    Same as get_related_fields, but computed only once per model.
+    The returned dict is shared, so it must not be modified.
+    """
+    related_fields = _related_fields_cache.get(model)
+    if related_fields is None:
+        related_fields = get_related_fields(model)
+        _related_fields_cache[model] = related_fields
+    return related_fields
+
+
+def find_related_field(model, field):
+    """
+    find_field over the cached related fields of the given model
+    """
+    return find_field(field, get_cached_related_fields(model))
+
+
 def recursive_params(
     selection_set, fragments, available_related_fields, select_related, prefetch_related
 ):
@@ -349,7 +375,7 @@ def recursive_params(
 def queryset_factory(manager, root, info, **kwargs):
     select_related = set()
     prefetch_related = set()
-    available_related_fields = get_related_fields(manager.model)
+    available_related_fields = get_cached_related_fields(manager.model)
 
     for f in kwargs.keys():
         temp = available_related_fields.get(f.split("__", 1)[0], None)
@@ -5,3 +5,15 @@ from rest_framework import serializers
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = auth_models.User
+
+
+class GroupSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = auth_models.Group
+        fields = ("id", "name")
+
+
+class PermissionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = auth_models.Permission
+        fields = "__all__"
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from graphene import Field, InputField
+
+from graphene_django_extras.converter import (
+    _cached_construct_fields,
+    construct_and_yank_fields,
+    reset_construct_fields_cache,
+)
+from graphene_django_extras.registry import Registry
+
+
+class ConstructAndYankFieldsTest(TestCase):
+    def setUp(self):
+        reset_construct_fields_cache()
+        self.registry = Registry()
+
+    def tearDown(self):
+        reset_construct_fields_cache()
+
+    def construct(self, only_fields=(), exclude_fields=(), input_flag=None, _as=Field):
+        return construct_and_yank_fields(
+            User, self.registry, only_fields, (), exclude_fields, input_flag, (), _as
+        )
+
+    def test_hit_returns_equal_independent_copy(self):
+        first = self.construct(only_fields=("id", "username"))
+        second = self.construct(only_fields=["username", "id"])
+
+        self.assertEqual(_cached_construct_fields.cache_info().hits, 1)
+        self.assertIsInstance(second, OrderedDict)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        first.pop("username")
+        first["extra"] = Field(User)
+        self.assertEqual(list(self.construct(only_fields=("id", "username"))), ["id", "username"])
+
+    def test_different_only_fields_miss(self):
+        self.assertEqual(list(self.construct(only_fields=("username",))), ["username"])
+        self.assertEqual(list(self.construct(only_fields=("email",))), ["email"])
+        self.assertEqual(_cached_construct_fields.cache_info().hits, 0)
+
+    def test_different_exclude_fields_miss(self):
+        with_email = self.construct(exclude_fields=("password",))
+        without_email = self.construct(exclude_fields=("password", "email"))
+
+        self.assertIn("email", with_email)
+        self.assertNotIn("email", without_email)
+        self.assertEqual(_cached_construct_fields.cache_info().hits, 0)
+
+    def test_different_input_flag_and_mount_miss(self):
+        output_fields = self.construct(only_fields=("username",))
+        create_fields = self.construct(
+            only_fields=("username",), input_flag="create", _as=InputField
+        )
+        update_fields = self.construct(
+            only_fields=("username",), input_flag="update", _as=InputField
+        )
+
+        self.assertIsInstance(output_fields["username"], Field)
+        self.assertIsInstance(create_fields["username"], InputField)
+        self.assertIsNot(create_fields["username"], update_fields["username"])
+        self.assertEqual(_cached_construct_fields.cache_info().hits, 0)
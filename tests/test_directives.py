@@ -1,5 +1,7 @@
 from django.test import TestCase
 
+from tests import factories
+from tests.client import Client
 from tests.test_fields import ParentTest
 
 
@@ -16,3 +18,30 @@ class DateDirective_Time_Test(ParentTest, TestCase):
 class DateDirective_Date_Test(ParentTest, TestCase):
     query = """query { date @date(format:"YYYY.MM.DD") }"""
     expected_return_payload = {"data": {"date": "2020.12.31"}}
+
+
+class ListDirectiveTest(TestCase):
+    def setUp(self):
+        factories.UserFactory()
+        factories.UserFactory(username="graphene")
+        self.client = Client()
+
+    def get_usernames(self, query):
+        response = self.client.query(query)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [user["username"] for user in response.json()["data"]["allUsers2"]]
+
+    def test_shuffle(self):
+        usernames = self.get_usernames("""query { allUsers2 @shuffle { username } }""")
+        self.assertEqual(len(usernames), 2)
+        self.assertEqual(set(usernames), {"graphql", "graphene"})
+
+    def test_sample_caps_k_at_list_length(self):
+        usernames = self.get_usernames("""query { allUsers2 @sample(k: 5) { username } }""")
+        self.assertEqual(len(usernames), 2)
+        self.assertEqual(set(usernames), {"graphql", "graphene"})
+
+    def test_sample(self):
+        usernames = self.get_usernames("""query { allUsers2 @sample(k: 1) { username } }""")
+        self.assertEqual(len(usernames), 1)
+        self.assertIn(usernames[0], {"graphql", "graphene"})
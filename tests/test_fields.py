@@ -34,6 +34,10 @@ class DjangoListObjectFieldTest(ParentTest, TestCase):
     def test_field(self):
         self.assertEqual(self.data["data"]["allUsers"]["results"][0]["id"], str(self.user.id))
 
+    def test_count_is_not_queried_when_not_requested(self):
+        with self.assertNumQueries(1):
+            self.client.query(self.query)
+
 
 class DjangoFilterPaginateListFieldTest(ParentTest, TestCase):
     query = queries.ALL_USERS1
@@ -124,6 +128,12 @@ class DjangoSerializerTypeTest(ParentTest, TestCase):
         self.assertTrue(data["data"]["user2"])
         self.assertEqual(data["data"]["user2"]["username"], self.user.username)
 
+    def test_filter_single_object_not_found(self):
+        query = queries.USER % {"filter": "id: 0", "fields": "username"}
+        response = self.client.query(query)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json(), {"data": {"user2": None}})
+
 
 class DjangoCustomResolverTest(ParentTest, TestCase):
     query = queries.ALL_USERS4
@@ -0,0 +1,68 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from graphene_django_extras.filters.filter import (
+    filter_queryset,
+    get_filterset_class,
+    reset_filterset_cache,
+)
+from tests.filtersets import UserFilterSet
+
+
+class GetFilterSetClassTest(TestCase):
+    def tearDown(self):
+        reset_filterset_cache()
+
+    def test_same_meta_returns_cached_class(self):
+        fields = {"username": ("icontains", "iexact")}
+        first = get_filterset_class(None, model=User, fields=fields)
+        second = get_filterset_class(None, model=User, fields=dict(fields))
+        self.assertIs(first, second)
+
+    def test_different_meta_returns_new_class(self):
+        first = get_filterset_class(None, model=User, fields=["username"])
+        second = get_filterset_class(None, model=User, fields=["email"])
+        self.assertIsNot(first, second)
+
+    def test_given_filterset_class_is_cached(self):
+        first = get_filterset_class(UserFilterSet, model=User, fields=["username"])
+        second = get_filterset_class(UserFilterSet, model=User, fields=["email"])
+        self.assertIs(first, second)
+        self.assertTrue(issubclass(first, UserFilterSet))
+
+
+class FilterQuerysetTest(TestCase):
+    def tearDown(self):
+        reset_filterset_cache()
+
+    def test_empty_data_returns_queryset_untouched(self):
+        queryset = User.objects.all()
+        filterset_class = get_filterset_class(None, model=User, fields=["username"])
+        self.assertIs(filter_queryset(filterset_class, {}, queryset), queryset)
+
+    def test_given_filterset_runs_without_data(self):
+        queryset = User.objects.all()
+        filtered = filter_queryset(get_filterset_class(UserFilterSet), {}, queryset)
+        self.assertIsNot(filtered, queryset)
+
+    def test_custom_qs_runs_without_data(self):
+        class StaffFilterSet(UserFilterSet):
+            @property
+            def qs(self):
+                return super().qs.filter(is_staff=True)
+
+        queryset = User.objects.all()
+        filtered = filter_queryset(get_filterset_class(StaffFilterSet), {}, queryset)
+        self.assertIsNot(filtered, queryset)
+        self.assertIn("is_staff", str(filtered.query))
+
+    def test_custom_init_runs_without_data(self):
+        class ActiveFilterSet(UserFilterSet):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.queryset = self.queryset.filter(is_active=True)
+
+        User.objects.create(username="inactive", is_active=False)
+        queryset = User.objects.all()
+        filtered = filter_queryset(get_filterset_class(ActiveFilterSet), {}, queryset)
+        self.assertEqual(list(filtered), [])
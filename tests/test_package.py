@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+from django.test import SimpleTestCase
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SETUP_DJANGO = """
+import django
+from django.conf import settings
+
+settings.configure(INSTALLED_APPS=["django.contrib.contenttypes", "django.contrib.auth"])
+django.setup()
+"""
+
+
+class LazyImportTest(SimpleTestCase):
+    def run_python(self, code, setup_django=True):
+        code = textwrap.dedent(code)
+        if setup_django:
+            code = SETUP_DJANGO + code
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_bare_import_loads_no_submodules(self):
+        code = """
+            import sys
+
+            import graphene_django_extras
+
+            loaded = [name for name in sys.modules if name.startswith("graphene_django_extras.")]
+            assert not loaded, loaded
+        """
+        self.run_python(code, setup_django=False)
+
+    def test_star_import(self):
+        code = """
+            import graphene_django_extras
+
+            namespace = {}
+            exec("from graphene_django_extras import *", namespace)
+            missing = set(graphene_django_extras.__all__) - set(namespace)
+            assert not missing, missing
+        """
+        self.run_python(code)
+
+    def test_submodule_access(self):
+        code = """
+            import graphene_django_extras
+
+            assert graphene_django_extras.types.DjangoObjectType is not None
+            assert hasattr(graphene_django_extras, "directives")
+            assert not hasattr(graphene_django_extras, "missing_submodule")
+        """
+        self.run_python(code)
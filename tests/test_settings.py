@@ -0,0 +1,13 @@
+from django.test import TestCase, override_settings
+
+from graphene_django_extras.settings import graphql_api_settings
+
+
+class GraphQLAPISettingsTest(TestCase):
+    def test_default_value(self):
+        self.assertIsNone(graphql_api_settings.DEFAULT_PAGE_SIZE)
+
+    def test_reload_on_setting_changed(self):
+        with override_settings(GRAPHENE_DJANGO_EXTRAS={"DEFAULT_PAGE_SIZE": 10}):
+            self.assertEqual(graphql_api_settings.DEFAULT_PAGE_SIZE, 10)
+        self.assertIsNone(graphql_api_settings.DEFAULT_PAGE_SIZE)
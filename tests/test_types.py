@@ -0,0 +1,368 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth.models import Group, Permission, User
+from django.contrib.contenttypes.models import ContentType
+from django.test import RequestFactory, TestCase
+from graphene import ID, Boolean, Int, String
+
+from graphene_django_extras import (
+    DjangoInputObjectType,
+    DjangoListObjectType,
+    DjangoObjectType,
+    DjangoSerializerType,
+)
+from graphene_django_extras.base_types import DjangoListObjectBase, factory_type
+from graphene_django_extras.paginations import LimitOffsetGraphqlPagination
+from graphene_django_extras.registry import Registry, reset_global_registry
+from graphene_django_extras.types import get_serializer_select_related
+from tests import factories
+from tests.serializers import GroupSerializer, PermissionSerializer, UserSerializer
+
+
+class DjangoListObjectBaseTest(TestCase):
+    def setUp(self):
+        factories.UserFactory()
+        factories.UserFactory(username="graphene")
+
+    def test_count_is_lazy(self):
+        with self.assertNumQueries(0):
+            list_object = DjangoListObjectBase(results=User.objects.all())
+
+        with self.assertNumQueries(1):
+            self.assertEqual(list_object.count, 2)
+            self.assertEqual(list_object.count, 2)
+
+    def test_given_count_is_used(self):
+        list_object = DjangoListObjectBase(results=User.objects.all(), count=10)
+        with self.assertNumQueries(0):
+            self.assertEqual(list_object.count, 10)
+
+    def test_to_dict_from_values(self):
+        list_object = DjangoListObjectBase(
+            results=User.objects.order_by("username"), results_field_name="users"
+        )
+        self.assertEqual(
+            list_object.to_dict_from_values("username"),
+            {"users": [{"username": "graphene"}, {"username": "graphql"}], "count": 2},
+        )
+
+
+class TypeMetaValidationTest(TestCase):
+    def test_object_type_requires_a_model(self):
+        with self.assertRaisesMessage(TypeError, "valid Django Model in InvalidType.Meta"):
+
+            class InvalidType(DjangoObjectType):
+                class Meta:
+                    model = object
+
+    def test_object_type_requires_a_registry(self):
+        with self.assertRaisesMessage(TypeError, "registry in InvalidType needs"):
+
+            class InvalidType(DjangoObjectType):
+                class Meta:
+                    model = User
+                    registry = object()
+
+    def test_input_object_type_requires_a_model(self):
+        with self.assertRaisesMessage(TypeError, "valid Django Model in InvalidInput.Meta"):
+
+            class InvalidInput(DjangoInputObjectType):
+                class Meta:
+                    model = object
+
+    def test_input_object_type_requires_a_valid_input_for(self):
+        with self.assertRaisesMessage(ValueError, "valid input_for value in InvalidInput.Meta"):
+
+            class InvalidInput(DjangoInputObjectType):
+                class Meta:
+                    model = User
+                    input_for = "list"
+
+    def test_list_object_type_requires_a_queryset(self):
+        with self.assertRaisesMessage(TypeError, "queryset in InvalidListType needs"):
+
+            class InvalidListType(DjangoListObjectType):
+                class Meta:
+                    model = User
+                    queryset = [1, 2]
+
+
+class DjangoSerializerTypeQuerysetTest(TestCase):
+    def test_queryset_is_not_evaluated(self):
+        active_users = User.objects.filter(is_active=True)
+        with self.assertNumQueries(0):
+
+            class ActiveUserModelType(DjangoSerializerType):
+                class Meta:
+                    serializer_class = UserSerializer
+                    queryset = active_users
+
+        self.assertIs(ActiveUserModelType._meta.queryset, active_users)
+        self.assertIsNone(active_users._result_cache)
+
+
+class ManageNestedFieldsTest(TestCase):
+    def create_group(self, serializer_type, name="staff"):
+        info = SimpleNamespace(context=RequestFactory().post("/"))
+        return serializer_type.create(None, info, new_group={"name": name})
+
+    def test_skipped_without_nested_fields(self):
+        class GroupModelType(DjangoSerializerType):
+            class Meta:
+                serializer_class = GroupSerializer
+
+        self.assertFalse(GroupModelType._meta.manages_nested_fields)
+        with mock.patch.object(GroupModelType, "manage_nested_fields") as manage_nested_fields:
+            result = self.create_group(GroupModelType)
+
+        manage_nested_fields.assert_not_called()
+        self.assertTrue(result.ok)
+        self.assertTrue(Group.objects.filter(name="staff").exists())
+
+    def test_runs_with_nested_fields(self):
+        class GroupModelType(DjangoSerializerType):
+            class Meta:
+                serializer_class = GroupSerializer
+                nested_fields = {"permissions": GroupSerializer}
+
+        self.assertTrue(GroupModelType._meta.manages_nested_fields)
+        with mock.patch.object(
+            GroupModelType, "manage_nested_fields", return_value={}
+        ) as manage_nested_fields:
+            result = self.create_group(GroupModelType)
+
+        manage_nested_fields.assert_called_once()
+        self.assertTrue(result.ok)
+
+    def test_runs_when_overridden(self):
+        calls = []
+
+        class GroupModelType(DjangoSerializerType):
+            class Meta:
+                serializer_class = GroupSerializer
+
+            @staticmethod
+            def manage_nested_fields(data, root, info):
+                calls.append(data["name"])
+                return {}
+
+        class ClassMethodGroupModelType(DjangoSerializerType):
+            class Meta:
+                serializer_class = GroupSerializer
+
+            @classmethod
+            def manage_nested_fields(cls, data, root, info):
+                calls.append(data["name"])
+                return {}
+
+        self.assertTrue(GroupModelType._meta.manages_nested_fields)
+        self.assertTrue(ClassMethodGroupModelType._meta.manages_nested_fields)
+        self.create_group(GroupModelType, "staff")
+        self.create_group(ClassMethodGroupModelType, "admins")
+        self.assertEqual(calls, ["staff", "admins"])
+
+
+class MutationArgumentsTest(TestCase):
+    def setUp(self):
+        class GroupModelType(DjangoSerializerType):
+            class Meta:
+                serializer_class = GroupSerializer
+
+        self.serializer_type = GroupModelType
+
+    def test_query_fields_do_not_build_arguments(self):
+        with mock.patch(
+            "graphene_django_extras.types.build_mutation_arguments"
+        ) as build_mutation_arguments:
+            self.serializer_type.QueryFields()
+            arguments = self.serializer_type._meta.arguments
+            self.assertEqual(list(arguments), ["create", "delete", "update"])
+            self.assertEqual(len(arguments), 3)
+            self.assertIn("create", arguments)
+            self.assertNotIn("list", arguments)
+
+        build_mutation_arguments.assert_not_called()
+
+    def test_mutation_fields_arguments(self):
+        create_field, delete_field, update_field = self.serializer_type.MutationFields()
+
+        self.assertEqual(list(create_field.args), ["new_group"])
+        self.assertEqual(list(update_field.args), ["new_group"])
+        self.assertEqual(list(delete_field.args), ["id"])
+        create_type = create_field.args["new_group"].type.of_type
+        update_type = update_field.args["new_group"].type.of_type
+        self.assertTrue(issubclass(create_type, DjangoInputObjectType))
+        self.assertEqual(create_type._meta.input_for, "create")
+        self.assertEqual(update_type._meta.input_for, "update")
+        self.assertEqual(delete_field.args["id"].type.of_type, ID)
+
+    def test_arguments_mapping(self):
+        arguments = dict(self.serializer_type._meta.arguments)
+
+        self.assertEqual(set(arguments), {"create", "delete", "update"})
+        self.assertIs(arguments["create"], self.serializer_type._meta.arguments["create"])
+        with self.assertRaises(KeyError):
+            self.serializer_type._meta.arguments["list"]
+        self.assertIsNone(self.serializer_type._meta.arguments.get("list"))
+
+
+class SerializerSelectRelatedTest(TestCase):
+    def get_select_related(self, **meta):
+        serializer_meta = type("Meta", (), dict(meta, model=Permission))
+        serializer_class = type(
+            "PermissionSerializer", (PermissionSerializer,), {"Meta": serializer_meta}
+        )
+        return get_serializer_select_related(serializer_class, Permission)
+
+    def test_all_fields(self):
+        self.assertEqual(self.get_select_related(fields="__all__"), ("content_type",))
+
+    def test_explicit_fields(self):
+        self.assertEqual(
+            self.get_select_related(fields=("name", "content_type")), ("content_type",)
+        )
+        self.assertEqual(self.get_select_related(fields=("name", "codename")), ())
+
+    def test_exclude(self):
+        self.assertEqual(self.get_select_related(exclude=("content_type",)), ())
+        self.assertEqual(self.get_select_related(exclude=("name",)), ("content_type",))
+
+    def test_reverse_and_many_to_many_relations_are_skipped(self):
+        self.assertEqual(get_serializer_select_related(GroupSerializer, Group), ())
+
+    def update_permission(self, permission_serializer):
+        class PermissionModelType(DjangoSerializerType):
+            class Meta:
+                serializer_class = permission_serializer
+
+        permission = Permission.objects.create(
+            name="Can test",
+            codename="can_test",
+            content_type=ContentType.objects.get_for_model(User),
+        )
+        info = SimpleNamespace(context=RequestFactory().post("/"))
+
+        # Fetch the permission, then update it
+        with self.assertNumQueries(2):
+            result = PermissionModelType.update(
+                None, info, new_permission={"id": permission.pk, "name": "Can test more"}
+            )
+
+        self.assertTrue(result.ok, result.errors)
+        permission.refresh_from_db()
+        self.assertEqual(permission.name, "Can test more")
+        return result.permission
+
+    def test_update_fetches_forward_relations(self):
+        permission = self.update_permission(PermissionSerializer)
+        with self.assertNumQueries(0):
+            self.assertEqual(permission.content_type.model, "user")
+
+    def test_update_fetches_only_serializer_relations(self):
+        class NamePermissionSerializer(PermissionSerializer):
+            class Meta:
+                model = Permission
+                exclude = ("content_type",)
+
+        permission = self.update_permission(NamePermissionSerializer)
+        with self.assertNumQueries(1):
+            self.assertEqual(permission.content_type.model, "user")
+
+
+class FactoryTypeCacheTest(TestCase):
+    def setUp(self):
+        reset_global_registry()
+        self.registry = Registry()
+
+    def tearDown(self):
+        reset_global_registry()
+
+    def build(self, operation, _type, *args, **kwargs):
+        return factory_type(
+            operation,
+            _type,
+            *args,
+            model=Group,
+            registry=self.registry,
+            skip_registry=True,
+            **kwargs
+        )
+
+    def test_output_type_is_shared_between_list_and_serializer_types(self):
+        class GroupListType(DjangoListObjectType):
+            class Meta:
+                model = Group
+                pagination = LimitOffsetGraphqlPagination()
+
+        class GroupModelType(DjangoSerializerType):
+            class Meta:
+                serializer_class = GroupSerializer
+
+        self.assertIs(GroupModelType._meta.output_type, GroupListType._meta.baseType)
+
+    def test_same_arguments_hit(self):
+        self.assertIs(
+            self.build("output", DjangoObjectType, only_fields=("name",)),
+            self.build("output", DjangoObjectType, only_fields=("name",)),
+        )
+
+    def test_different_only_fields_miss(self):
+        name_type = self.build("output", DjangoObjectType, only_fields=("name",))
+        id_type = self.build("output", DjangoObjectType, only_fields=("id",))
+
+        self.assertIsNot(name_type, id_type)
+        self.assertEqual(list(name_type._meta.fields), ["name"])
+        self.assertEqual(list(id_type._meta.fields), ["id"])
+
+    def test_different_input_for_miss(self):
+        create_type = self.build("input", DjangoInputObjectType, "create")
+        update_type = self.build("input", DjangoInputObjectType, "update")
+
+        self.assertIsNot(create_type, update_type)
+        self.assertEqual(create_type._meta.input_for, "create")
+        self.assertEqual(update_type._meta.input_for, "update")
+
+    def test_reset_global_registry_clears_cache(self):
+        first = self.build("output", DjangoObjectType)
+        reset_global_registry()
+        self.assertIsNot(first, self.build("output", DjangoObjectType))
+
+
+class DjangoInputObjectTypeInheritanceTest(TestCase):
+    def setUp(self):
+        class GroupInput(DjangoInputObjectType):
+            name = Int()
+            extra = String()
+
+            class Meta:
+                model = Group
+                skip_registry = True
+
+        class ChildGroupInput(GroupInput):
+            extra = Boolean()
+            child = String()
+
+            class Meta:
+                model = Group
+                skip_registry = True
+
+        self.parent_fields = GroupInput._meta.fields
+        self.child_fields = ChildGroupInput._meta.fields
+
+    def test_declared_fields_override_model_fields(self):
+        self.assertEqual(self.parent_fields["name"].type, Int)
+        self.assertEqual(self.child_fields["name"].type, Int)
+
+    def test_parent_fields_are_inherited(self):
+        self.assertIn("permissions", self.child_fields)
+        self.assertEqual(self.child_fields["name"].type, Int)
+
+    def test_child_overrides_parent_fields(self):
+        self.assertEqual(self.parent_fields["extra"].type, String)
+        self.assertEqual(self.child_fields["extra"].type, Boolean)
+        self.assertEqual(self.child_fields["child"].type, String)
+        self.assertNotIn("child", self.parent_fields)
+
+    def test_fields_are_not_shared(self):
+        self.assertIsNot(self.parent_fields["name"], self.child_fields["name"])
@@ -0,0 +1,20 @@
+from django.contrib.auth.models import Group, User
+from django.test import SimpleTestCase
+from graphql import parse
+
+from graphene_django_extras.utils import find_related_field
+
+
+def field_node(name):
+    return parse("{ %s { id } }" % name).definitions[0].selection_set.selections[0]
+
+
+class FindRelatedFieldTest(SimpleTestCase):
+    def test_finds_field_by_graphql_name(self):
+        self.assertEqual(find_related_field(User, field_node("groups")).name, "groups")
+        self.assertEqual(find_related_field(Group, field_node("user")).name, "user")
+        self.assertIsNone(find_related_field(User, field_node("username")))
+
+    def test_finds_camel_case_field(self):
+        field = find_related_field(User, field_node("userPermissions"))
+        self.assertEqual(field.name, "user_permissions")